@@ -12,13 +12,17 @@ implement our own MPD server which is compatible with the numerous existing
 
 from __future__ import annotations
 
+import functools
 import inspect
+import sys
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, TypeAlias
 
 from mopidy_mpd import exceptions
 
 if TYPE_CHECKING:
+    from types import CodeType
+
     from mopidy_mpd.context import MpdContext
 
 #: The MPD protocol uses UTF-8 for encoding all data.
@@ -39,10 +43,13 @@ Result: TypeAlias = None | ResultDict | ResultTuple | ResultList
 HandlerFunc: TypeAlias = Callable[..., Result]
 
 
+@functools.cache
 def load_protocol_modules() -> None:
     """
     The protocol modules must be imported to get them registered in
     :attr:`commands`.
+
+    Only the first call does any work; later calls return immediately.
     """
     from . import (  # noqa: F401
         audio_output,
@@ -72,6 +79,7 @@ def UINT(value: str) -> int:  # noqa: N802
     r"""Converts a value that matches \d+ into an integer."""
     if value is None:
         raise ValueError("None is not a valid integer")
+    # int() alone would also accept signs, whitespace and underscores.
     if not value.isdigit():
         raise ValueError("Only positive numbers are allowed")
     return int(value)
@@ -96,8 +104,10 @@ def UFLOAT(value: str) -> float:  # noqa: N802
 
 def BOOL(value: str) -> bool:  # noqa: N802
     """Convert the values 0 and 1 into booleans."""
-    if value in ("1", "0"):
-        return bool(int(value))
+    if value == "1":
+        return True
+    if value == "0":
+        return False
     raise ValueError(f"{value!r} is not 0 or 1")
 
 
@@ -108,18 +118,19 @@ def RANGE(value: str) -> slice:  # noqa: N802
     ``n:`` should become ``slice(n, None)``
     ``n:m`` should become ``slice(n, m)`` and ``m > n`` must hold
     """
-    if ":" in value:
-        start, stop = value.split(":", 1)
-        start = UINT(start)
-        if stop.strip():
-            stop = UINT(stop)
-            if start >= stop:
-                raise ValueError("End must be larger than start")
-        else:
-            stop = None
-    else:
-        start = UINT(value)
-        stop = start + 1
+    head, sep, tail = value.partition(":")
+    if not head.isdigit():
+        raise ValueError("Only positive numbers are allowed")
+    start = int(head)
+    if not sep:
+        return slice(start, start + 1)
+    if not tail.strip():
+        return slice(start, None)
+    if not tail.isdigit():
+        raise ValueError("Only positive numbers are allowed")
+    stop = int(tail)
+    if start >= stop:
+        raise ValueError("End must be larger than start")
     return slice(start, stop)
 
 
@@ -130,6 +141,8 @@ class Commands:
     installed into.
     """
 
+    __slots__ = ("handlers",)
+
     def __init__(self) -> None:
         self.handlers: dict[str, Handler] = {}
 
@@ -162,6 +175,7 @@ class Commands:
         :param auth_required: If authorization is required.
         :param list_command: If command should be listed in reflection.
         """
+        name = sys.intern(name)
 
         def wrapper(func: HandlerFunc) -> HandlerFunc:
             if name in self.handlers:
@@ -193,10 +207,11 @@ class Commands:
         """
         if not tokens:
             raise exceptions.MpdNoCommandError
-        command, tokens = tokens[0], tokens[1:]
-        if command not in self.handlers:
+        command = tokens[0]
+        handler = self.handlers.get(command)
+        if handler is None:
             raise exceptions.MpdUnknownCommandError(command=command)
-        return self.handlers[command](context, *tokens)
+        return handler.call(context, tokens)
 
 
 #: Global instance to install commands into
@@ -204,6 +219,19 @@ commands = Commands()
 
 
 class Handler:
+    __slots__ = (
+        "arg_names",
+        "auth_required",
+        "call",
+        "defaults",
+        "func",
+        "list_command",
+        "name",
+        "num_required",
+        "spec",
+        "validators",
+    )
+
     def __init__(
         self,
         *,
@@ -227,40 +255,83 @@ class Handler:
         if len(self.spec.args) > 1 and self.spec.varargs:
             raise TypeError("*args may not be combined with regular arguments")
 
-        if not set(self.validators.keys()).issubset(self.spec.args):
+        if any(key not in self.spec.args for key in self.validators):
             raise TypeError("Validator for non-existent arg passed")
 
         if self.spec.varkw or self.spec.kwonlyargs:
             raise TypeError("Keyword arguments are not permitted")
 
+        self.arg_names = tuple(self.spec.args)
+        defaults = self.spec.defaults or ()
+        self.num_required = len(self.arg_names) - len(defaults)
         self.defaults = dict(
-            zip(
-                self.spec.args[-len(self.spec.defaults or []) :],
-                self.spec.defaults or [],
-                strict=False,
-            )
+            zip(self.arg_names[self.num_required :], defaults, strict=True)
         )
 
-    def __call__(self, *args: Any, **kwargs: Any) -> Result:
+        self.call = self._compile()
+
+    def _compile(self) -> Callable[[MpdContext, list[str]], Result]:
+        """Generate a function specialized for this handler's arguments.
+
+        The generated function takes the context and the full list of request
+        tokens, with the command name as the first token. It checks the number
+        of arguments, fills in defaults and runs the validators with
+        straight-line code, reading each argument directly from the token list,
+        and then calls the real handler with positional arguments.
+        """
+        namespace: dict[str, Any] = {
+            "MpdArgError": exceptions.MpdArgError,
+            "func": self.func,
+            "arity_message": f'wrong number of arguments for "{self.name}"',
+        }
+        lines = ["def call(context, tokens):"]
+
         if self.spec.varargs:
-            return self.func(*args, **kwargs)
-
-        try:
-            ba = inspect.signature(self.func).bind(*args, **kwargs)
-            ba.apply_defaults()
-            callargs = ba.arguments
-        except TypeError as exc:
-            raise exceptions.MpdArgError(
-                f'wrong number of arguments for "{self.name}"'
-            ) from exc
-
-        for key, value in callargs.items():
-            if value == self.defaults.get(key, object()):
-                continue
-            if validator := self.validators.get(key):
-                try:
-                    callargs[key] = validator(value)
-                except ValueError as exc:
-                    raise exceptions.MpdArgError("incorrect arguments") from exc
-
-        return self.func(**callargs)
+            lines.append("    return func(context, *tokens[1:])")
+        else:
+            # The context takes the place of the command name, so the number
+            # of tokens equals the number of positional arguments.
+            num_args = len(self.arg_names)
+            lines.append("    n = len(tokens)")
+            if self.num_required == num_args:
+                lines.append(f"    if n != {num_args}:")
+            else:
+                lines.append(f"    if n < {self.num_required} or n > {num_args}:")
+            lines.append("        raise MpdArgError(arity_message)")
+
+            values = []
+            conversions = []
+            for i, key in enumerate(self.arg_names):
+                value = f"tokens[{i}]" if i else "context"
+                if key in self.validators:
+                    namespace[f"validator_{i}"] = self.validators[key]
+                    value = f"validator_{i}({value})"
+                if i >= self.num_required:
+                    namespace[f"default_{i}"] = self.defaults[key]
+                    value = f"{value} if n > {i} else default_{i}"
+                if key in self.validators:
+                    conversions.append(f"        arg_{i} = {value}")
+                    value = f"arg_{i}"
+                elif i >= self.num_required:
+                    value = f"({value})"
+                values.append(value)
+
+            if conversions:
+                lines.append("    try:")
+                lines.extend(conversions)
+                lines.append("    except ValueError as exc:")
+                lines.append(
+                    '        raise MpdArgError("incorrect arguments") from exc'
+                )
+            lines.append(f"    return func({', '.join(values)})")
+
+        code = _compile_source("\n".join(lines))
+        exec(code, namespace)  # noqa: S102
+        return namespace["call"]
+
+
+@functools.cache
+def _compile_source(source: str) -> CodeType:
+    # Handlers with the same argument layout share the same source, and thus
+    # the same code object.
+    return compile(source, "<mpd handler>", "exec")
@@ -90,15 +90,17 @@ def tagtypes(context: MpdContext, *args: str) -> protocol.Result:
         subcommand = parameters.pop(0).lower()
         match subcommand:
             case "all":
-                context.session.tagtypes.update(tagtype_list.TAGTYPE_LIST)
+                context.session.tagtypes = tagtype_list.TAGTYPE_LIST
             case "clear":
-                context.session.tagtypes.clear()
+                context.session.tagtypes = frozenset()
             case "disable":
                 _validate_tagtypes(parameters)
-                context.session.tagtypes.difference_update(parameters)
+                context.session.tagtypes = context.session.tagtypes.difference(
+                    parameters
+                )
             case "enable":
                 _validate_tagtypes(parameters)
-                context.session.tagtypes.update(parameters)
+                context.session.tagtypes = context.session.tagtypes.union(parameters)
             case _:
                 raise exceptions.MpdArgError("Unknown sub command")
         return None
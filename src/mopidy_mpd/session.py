@@ -14,6 +14,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+#: Greeting sent to every new client, ready to go out on the wire.
+GREETING = (
+    f"OK MPD {protocol.VERSION}".encode(protocol.ENCODING) + protocol.LINE_TERMINATOR
+)
+
 
 class MpdSessionKwargs(TypedDict):
     config: types.Config
@@ -46,19 +51,20 @@ class MpdSession(network.LineProtocol):
             uri_map=uri_map,
             session=self,
         )
-        self.tagtypes = tagtype_list.TAGTYPE_LIST.copy()
+        self.tagtypes: frozenset[str] = tagtype_list.TAGTYPE_LIST
+        self._terminator_str = self.decode(self.terminator)
 
     def on_start(self) -> None:
         logger.info("New MPD connection from %s", self.connection)
-        self.send_lines([f"OK MPD {protocol.VERSION}"])
+        self.connection.queue_send(GREETING)
 
     def on_line_received(self, line: str) -> None:
         logger.debug("Request from %s: %s", self.connection, line)
 
-        # All mpd commands start with a lowercase alphabetic character
+        # All mpd commands start with a lowercase ASCII letter.
         # To prevent CSRF attacks, requests starting with an invalid
         # character are immediately dropped.
-        if len(line) == 0 or not (line[0].islower() and line[0].isalpha()):
+        if not line or not "a" <= line[0] <= "z":
             self.connection.stop("Malformed command")
             return
 
@@ -66,11 +72,12 @@ class MpdSession(network.LineProtocol):
         if not response:
             return
 
-        logger.debug(
-            "Response to %s: %s",
-            self.connection,
-            formatting.indent(self.decode(self.terminator).join(response)),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Response to %s: %s",
+                self.connection,
+                formatting.indent(self._terminator_str.join(response)),
+            )
 
         self.send_lines(response)
 
@@ -78,6 +85,9 @@ class MpdSession(network.LineProtocol):
         self.dispatcher.handle_idle(subsystem)
 
     def decode(self, line: bytes) -> str:
+        # Requests are nearly always plain ASCII, which is valid UTF-8 as is.
+        if line.isascii():
+            return line.decode("ascii")
         try:
             return super().decode(line)
         except ValueError:
@@ -88,5 +98,10 @@ class MpdSession(network.LineProtocol):
             self.stop()
             return Never
 
+    def join_lines(self, lines: list[str]) -> str:
+        if not lines:
+            return ""
+        return self._terminator_str.join(lines) + self._terminator_str
+
     def close(self) -> None:
         self.stop()
@@ -10,6 +10,7 @@ from mopidy_mpd.protocol import tagtype_list
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Sequence
+    from collections.abc import Set as AbstractSet
 
     from mopidy_mpd import protocol
 
@@ -18,7 +19,7 @@ logger = logging.getLogger(__name__)
 
 def track_to_mpd_format(  # noqa: C901, PLR0912, PLR0915
     obj: Track | TlTrack,
-    tagtypes: set[str],
+    tagtypes: AbstractSet[str],
     *,
     position: int | None = None,
     stream_title: str | None = None,
@@ -113,7 +114,7 @@ def track_to_mpd_format(  # noqa: C901, PLR0912, PLR0915
 
 
 def _has_value(
-    tagtypes: set[str],
+    tagtypes: AbstractSet[str],
     tagtype: str,
     value: protocol.ResultValue,
 ) -> bool:
@@ -173,7 +174,7 @@ def multi_tag_list(
 
 def tracks_to_mpd_format(
     tracks: Sequence[Track | TlTrack],
-    tagtypes: set[str],
+    tagtypes: AbstractSet[str],
     *,
     start: int = 0,
     end: int | None = None,
@@ -204,7 +205,7 @@ def tracks_to_mpd_format(
 
 def playlist_to_mpd_format(
     playlist: Playlist,
-    tagtypes: set[str],
+    tagtypes: AbstractSet[str],
     *,
     start: int = 0,
     end: int | None = None,
@@ -33,6 +33,11 @@ class ConnectionHandlerTest(protocol.BaseTestCase):
         self.assertNoResponse()
         self.connection.stop.assert_called_once_with("Malformed command")
 
+    def test_command_starting_with_non_ascii_letter_is_malformed(self):
+        self.send_request("état")
+        self.assertNoResponse()
+        self.connection.stop.assert_called_once_with("Malformed command")
+
     def test_tagtypes(self):
         self.send_request("tagtypes")
         self.assertInResponse("tagtype: Artist")
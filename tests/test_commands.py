@@ -27,6 +27,9 @@ class TestConverts(unittest.TestCase):
         self.assertRaises(ValueError, protocol.UINT, "")
         self.assertRaises(ValueError, protocol.UINT, "abc")
         self.assertRaises(ValueError, protocol.UINT, "12 34")
+        self.assertRaises(ValueError, protocol.UINT, " 123")
+        self.assertRaises(ValueError, protocol.UINT, "1_000")
+        self.assertRaises(ValueError, protocol.UINT, "-0")
 
     def test_boolean(self):
         assert protocol.BOOL("1") is True
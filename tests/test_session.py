@@ -1,7 +1,7 @@
 import logging
 from unittest.mock import Mock, sentinel
 
-from mopidy_mpd import dispatcher, network, session
+from mopidy_mpd import dispatcher, network, protocol, session
 
 
 def test_on_start_logged(caplog):
@@ -18,6 +18,21 @@ def test_on_start_logged(caplog):
     assert f"New MPD connection from {connection}" in caplog.text
 
 
+def test_on_start_sends_greeting():
+    connection = Mock(spec=network.Connection)
+
+    session.MpdSession(
+        config=None,
+        core=None,
+        uri_map=None,
+        connection=connection,
+    ).on_start()
+
+    connection.queue_send.assert_called_once_with(
+        f"OK MPD {protocol.VERSION}\n".encode()
+    )
+
+
 def test_on_line_received_logged(caplog):
     caplog.set_level(logging.DEBUG)
     connection = Mock(spec=network.Connection)
@@ -34,3 +49,29 @@ def test_on_line_received_logged(caplog):
 
     assert f"Request from {connection}: foobar" in caplog.text
     assert f"Response to {connection}:" in caplog.text
+
+
+def test_decode_handles_ascii_and_utf8():
+    mpd_session = session.MpdSession(
+        config=None,
+        core=None,
+        uri_map=None,
+        connection=Mock(spec=network.Connection),
+    )
+
+    assert mpd_session.decode(b"play 1") == "play 1"
+    assert mpd_session.decode("Björk".encode()) == "Björk"
+
+
+def test_send_lines_queues_a_single_buffer():
+    connection = Mock(spec=network.Connection)
+    mpd_session = session.MpdSession(
+        config=None,
+        core=None,
+        uri_map=None,
+        connection=connection,
+    )
+
+    mpd_session.send_lines(["volume: 50", "state: \x07play", "OK"])
+
+    connection.queue_send.assert_called_once_with(b"volume: 50\nstate: play\nOK\n")